@@ -10,6 +10,9 @@ from pathlib import Path
 
 from jinja2 import Environment, FileSystemLoader
 
+# Shared Jinja2 environment; templates are compiled once and not re-checked on disk
+_JINJA_ENV = Environment(loader=FileSystemLoader('.'), auto_reload=False)
+
 
 def main():
     """Main function with argparse CLI."""
@@ -42,9 +45,7 @@ def main():
         with open(json_file, 'r', encoding='utf-8') as f:
             ticket_info = json.load(f)
 
-        # Set up Jinja2 environment
-        env = Environment(loader=FileSystemLoader('.'))
-        template = env.get_template(template_file)
+        template = _JINJA_ENV.get_template(template_file)
 
         # Render template
         approved_email = template.render(ticket_info)
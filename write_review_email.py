@@ -4,20 +4,66 @@ Script to get ticket information from Jira API and generate review emails.
 """
 
 import argparse
+import functools
+import html
 import json
 import re
 import subprocess
 import sys
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader
-from jira import JIRA
+# Leading spaces on each line, converted to &nbsp; to preserve indentation
+_RE_LEADING = re.compile(r'^( +)', re.MULTILINE)
 
+# Placeholder values rendered into the cached review template HTML and later
+# replaced by the escaped ticket values. NUL never appears in the template and
+# is untouched by escaping and markdown conversion.
+_TEMPLATE_SENTINELS = {
+    key: f'\x00{key.upper()}\x00'
+    for key in ('author', 'title', 'fsds_number', 'review_deadline', 'signature')
+}
 
+# Markdown-style formatting converted to HTML in the review email: **bold**,
+# [link text](url) and line breaks, all handled in one pass by _md_dispatch
+_RE_MD = re.compile(r'\*\*(.*?)\*\*|\[([^\]]+)\]\(([^)]+)\)|\n')
+
+
+def _md_dispatch(match):
+    "Return the HTML replacement for a single _RE_MD match"
+    if match.group(1) is not None:
+        # Bold text may itself contain a link
+        return f'<strong>{_RE_MD.sub(_md_dispatch, match.group(1))}</strong>'
+    if match.group(2) is not None:
+        # Link text may itself contain bold text or line breaks
+        return f'<a href="{match.group(3)}">{_RE_MD.sub(_md_dispatch, match.group(2))}</a>'
+    return '<br>\n'
+
+
+@functools.lru_cache(maxsize=1)
+def _get_jinja_env():
+    """Return the shared Jinja2 environment.
+
+    Templates are compiled once and not re-checked on disk. jinja2 is imported
+    here so that ``--help`` and early errors do not pay its import cost.
+    """
+    from jinja2 import Environment, FileSystemLoader
+
+    return Environment(loader=FileSystemLoader('.'), auto_reload=False)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_jira_token():
+    "Read and return the Jira API token from ~/jira_api_token.txt"
+    return (Path.home() / "jira_api_token.txt").read_text().strip()
+
+
+@functools.lru_cache(maxsize=1)
 def init_jira_connection():
-    "Initializer and return a Jira connection object"
+    "Initializer and return a Jira connection object, reused on later calls"
+    from jira import JIRA
+
     JIRA_SERVER = "https://occ-cfa.cfa.harvard.edu/"
-    token_auth = (Path.home() / "jira_api_token.txt").read_text().strip()
+    token_auth = _load_jira_token()
     jira = JIRA(
         server=JIRA_SERVER,
         token_auth=token_auth,
@@ -28,21 +74,38 @@ def init_jira_connection():
     return jira
 
 
-def get_jira_issue(jira, fsds_number):
-    """Retrieve Jira issue object for given FSDS number.
+def get_jira_issues(jira, fsds_numbers):
+    """Retrieve Jira issue objects for given FSDS numbers in a single search.
+
+    Only the summary and reporter fields are fetched.
 
     Args:
         jira (JIRA): Authenticated JIRA connection object
-        fsds_number (int): FSDS ticket number
+        fsds_numbers (list of int): FSDS ticket numbers
+
+    Returns:
+        list: Jira issue objects in the same order as ``fsds_numbers``
     """
-    issue_key = f"FSDS-{fsds_number}"
+    issue_keys = [f"FSDS-{fsds_number}" for fsds_number in fsds_numbers]
     try:
-        issue = jira.issue(issue_key)
-        return issue
+        issues = jira.search_issues(
+            f"key in ({','.join(issue_keys)})",
+            fields="summary,reporter",
+            maxResults=False,
+        )
     except Exception as e:
-        print(f"Error retrieving issue {issue_key}: {e}")
+        print(f"Error retrieving issues {', '.join(issue_keys)}: {e}")
+        sys.exit(1)
+
+    issues_by_key = {issue.key: issue for issue in issues}
+    missing = [issue_key for issue_key in issue_keys if issue_key not in issues_by_key]
+    if missing:
+        print(f"Error retrieving issues {', '.join(missing)}: not found")
         sys.exit(1)
 
+    return [issues_by_key[issue_key] for issue_key in issue_keys]
+
+
 def get_title_reporter_from_issue(issue):
     """Extract title and reporter from Jira issue object.
 
@@ -54,6 +117,36 @@ def get_title_reporter_from_issue(issue):
     return title, reporter
 
 
+def get_ticket_infos_from_jira(fsds_numbers):
+    """
+    Get ticket information from Jira API for several FSDS numbers at once.
+
+    Args:
+        fsds_numbers (list of int): FSDS ticket numbers
+
+    Returns:
+        list: Dictionaries containing 'title', 'author', and 'fsds_number',
+            in the same order as ``fsds_numbers``
+    """
+    # Initialize Jira connection
+    jira = init_jira_connection()
+
+    # Get all issues from Jira in one request
+    issues = get_jira_issues(jira, fsds_numbers)
+
+    infos = []
+    for fsds_number, issue in zip(fsds_numbers, issues):
+        # Extract title and reporter
+        title, author = get_title_reporter_from_issue(issue)
+        infos.append({
+            'title': title,
+            'author': author,
+            'fsds_number': fsds_number
+        })
+
+    return infos
+
+
 def get_ticket_info_from_jira(fsds_number):
     """
     Get ticket information from Jira API using FSDS number.
@@ -64,20 +157,36 @@ def get_ticket_info_from_jira(fsds_number):
     Returns:
         dict: Dictionary containing 'title', 'author', and 'fsds_number'
     """
-    # Initialize Jira connection
-    jira = init_jira_connection()
+    return get_ticket_infos_from_jira([fsds_number])[0]
+
 
-    # Get issue from Jira
-    issue = get_jira_issue(jira, fsds_number)
+@functools.lru_cache(maxsize=None)
+def _get_template_html(template_file):
+    """
+    Render template to HTML body content with sentinels in place of the variables.
 
-    # Extract title and reporter
-    title, author = get_title_reporter_from_issue(issue)
+    Args:
+        template_file (str): Path to email template file
 
-    return {
-        'title': title,
-        'author': author,
-        'fsds_number': fsds_number
-    }
+    Returns:
+        str: HTML body content containing the _TEMPLATE_SENTINELS placeholders
+    """
+    template = _get_jinja_env().get_template(template_file)
+
+    # Render template
+    email_text = template.render(_TEMPLATE_SENTINELS)
+
+    # Convert to HTML while preserving whitespace and line breaks
+    # Escape HTML entities first
+    html_content = html.escape(email_text)
+
+    # Convert leading spaces to non-breaking spaces to preserve indentation
+    html_content = _RE_LEADING.sub(lambda m: '&nbsp;' * len(m.group(1)), html_content)
+
+    # Convert markdown-style **bold**, [link text](url) and line breaks to HTML
+    html_content = _RE_MD.sub(_md_dispatch, html_content)
+
+    return html_content
 
 
 def generate_review_email_html(ticket_info, template_file='email-template.md'):
@@ -91,8 +200,6 @@ def generate_review_email_html(ticket_info, template_file='email-template.md'):
     Returns:
         str: HTML formatted email content
     """
-    import html
-
     # Prepare template variables from ticket_info
     template_vars = {
         'author': ticket_info['author'],
@@ -102,35 +209,10 @@ def generate_review_email_html(ticket_info, template_file='email-template.md'):
         'signature': ticket_info['signature']
     }
 
-    # Set up Jinja2 environment
-    env = Environment(loader=FileSystemLoader('.'))
-    template = env.get_template(template_file)
-
-    # Render template
-    email_text = template.render(template_vars)
-
-    # Convert to HTML while preserving whitespace and line breaks
-    # Escape HTML entities first
-    html_content = html.escape(email_text)
-
-    # Convert leading spaces to non-breaking spaces to preserve indentation
-    lines = html_content.split('\n')
-    for i, line in enumerate(lines):
-        # Count leading spaces and convert them to &nbsp;
-        leading_spaces = len(line) - len(line.lstrip(' '))
-        if leading_spaces > 0:
-            lines[i] = '&nbsp;' * leading_spaces + line.lstrip(' ')
-    html_content = '\n'.join(lines)
-
-    # Convert markdown-style formatting to HTML
-    # Handle **bold** text
-    html_content = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', html_content)
-
-    # Handle [link text](url) markdown links
-    html_content = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', html_content)
-
-    # Replace line breaks with <br> tags
-    html_content = html_content.replace('\n', '<br>\n')
+    # Fill the ticket values into the cached HTML version of the template
+    html_content = _get_template_html(template_file)
+    for key, value in template_vars.items():
+        html_content = html_content.replace(_TEMPLATE_SENTINELS[key], html.escape(str(value)))
 
     # Wrap in basic HTML structure with default sans font and normal spacing
     full_html = f"""<!DOCTYPE html>
@@ -161,6 +243,10 @@ def generate_review_email_html(ticket_info, template_file='email-template.md'):
     return full_html
 
 
+# Calendar days from each weekday (Monday=0, Sunday=6) to 3 weekdays later
+_DAYS_TO_3_WEEKDAYS = (3, 3, 5, 5, 5, 4, 3)
+
+
 def calculate_review_deadline():
     """
     Calculate review deadline as 3 weekdays from today.
@@ -171,16 +257,9 @@ def calculate_review_deadline():
     from datetime import datetime, timedelta
 
     today = datetime.now()
-    weekdays_added = 0
-    current_date = today
+    current_date = today + timedelta(days=_DAYS_TO_3_WEEKDAYS[today.weekday()])
 
-    while weekdays_added < 3:
-        current_date += timedelta(days=1)
-        # Monday=0, Sunday=6, so weekdays are 0-4
-        if current_date.weekday() < 5:
-            weekdays_added += 1
-
-    return current_date.strftime("%A %B %d").replace(" 0", " ")
+    return f"{current_date:%A %B} {current_date.day}"
 
 
 def get_user_first_name():
@@ -215,6 +294,11 @@ def main():
         action='store_true',
         help='Automatically open the generated HTML file in browser'
     )
+    parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Write the ticket info JSON file indented for human reading'
+    )
 
     args = parser.parse_args()
 
@@ -225,23 +309,28 @@ def main():
         info['review_deadline'] = calculate_review_deadline()
         info['signature'] = get_user_first_name()
 
-        # Always show parsed information
-        print(f"FSDS Number: {info['fsds_number']}")
-        print(f"Title: {info['title']}")
-        print(f"Author: {info['author']}")
-
         # Write info dict to JSON file
         info_file = f"FSDS-{info['fsds_number']}-info.json"
         with open(info_file, 'w', encoding='utf-8') as f:
-            json.dump(info, f, indent=2)
-        print(f"Ticket info written to: {info_file}")
+            if args.pretty:
+                json.dump(info, f, indent=2)
+            else:
+                json.dump(info, f, separators=(',', ':'))
 
         # Generate HTML email
         html_email = generate_review_email_html(info)
         output_file = f"FSDS-{info['fsds_number']}-review-email.html"
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write(html_email)
-        print(f"HTML email written to: {output_file}")
+
+        # Always show parsed information and output files in a single write
+        sys.stdout.write(
+            f"FSDS Number: {info['fsds_number']}\n"
+            f"Title: {info['title']}\n"
+            f"Author: {info['author']}\n"
+            f"Ticket info written to: {info_file}\n"
+            f"HTML email written to: {output_file}\n"
+        )
 
         # Open in browser if requested
         if args.open: